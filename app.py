@@ -7,77 +7,379 @@ PyInstaller-ready application with embedded web server and system tray
 import sys
 import os
 import threading
+import time
+import hashlib
+import gzip
+import mimetypes
+import json
+import email.utils
 import webbrowser
 import socket
+import functools
+import importlib
+from datetime import datetime
 from pathlib import Path
 import http.server
 import socketserver
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from urllib.parse import urlparse
 
-# GUI imports
+# GUI and system tray support are imported on first use so headless
+# starts don't pay for loading Tk, pystray and PIL
+@functools.lru_cache(maxsize=None)
+def _gui_available():
+    """Check whether tkinter can be imported"""
+    try:
+        importlib.import_module('tkinter')
+        return True
+    except ImportError:
+        return False
+
+@functools.lru_cache(maxsize=None)
+def _tray_available():
+    """Check whether pystray and PIL can be imported"""
+    try:
+        for module in ('pystray', 'PIL.Image', 'PIL.ImageDraw'):
+            importlib.import_module(module)
+        return True
+    except ImportError:
+        return False
+
+# Fast JSON encoding/decoding (optional); both work directly on bytes
 try:
-    import tkinter as tk
-    from tkinter import messagebox, Menu
-    import tkinter.ttk as ttk
-    GUI_AVAILABLE = True
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
 except ImportError:
-    GUI_AVAILABLE = False
-
-# Try to import system tray support
+    def _json_default(obj):
+        # orjson handles datetimes and dataclasses natively; match its output
+        if isinstance(obj, datetime):
+            return obj.isoformat()
+        if hasattr(obj, 'to_dict'):
+            return obj.to_dict()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def _dumps(obj):
+        return json.dumps(obj, default=_json_default).encode()
+    _loads = json.loads
+
+# SharePoint integration (optional)
 try:
-    import pystray
-    from PIL import Image, ImageDraw
-    TRAY_AVAILABLE = True
+    from sharepoint_api import get_sharepoint_manager, shutdown as shutdown_sharepoint
+    SHAREPOINT_AVAILABLE = True
 except ImportError:
-    TRAY_AVAILABLE = False
+    SHAREPOINT_AVAILABLE = False
+
+# Encoded /api/sharepoint/events response, reused across dashboard refreshes
+_CACHE_TTL = 30.0
+_events_cache = {"ts": 0.0, "payload": None, "payload_gz": None, "etag": None, "generation": 0}
+_events_cache_lock = threading.Lock()
+
+# SharePoint calls run on a small shared pool; concurrent cache misses
+# wait on the same in-flight fetch instead of each calling SharePoint
+_SP_TIMEOUT = 30.0
+_sp_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="sp-graph")
+_events_inflight = None
+
+# Responses smaller than this aren't worth compressing
+_GZIP_MIN_SIZE = 1024
+
+# CORS headers added to static file responses, encoded once. API responses
+# never get them: only the dashboard's own pages may call the API
+_CORS_HEADERS = (b"Access-Control-Allow-Origin: *\r\n"
+                 b"Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n"
+                 b"Access-Control-Allow-Headers: *\r\n")
+
+# Fixed JSON response bodies, encoded once
+_LOGOUT_OK = json.dumps({'success': True}).encode()
+_NOT_INITIALIZED = json.dumps({'authenticated': False, 'error': 'Not initialized'}).encode()
+_NOT_AUTHENTICATED = json.dumps({'error': 'Not authenticated'}).encode()
+
+def stop_background_work():
+    """
+    Cancel pending SharePoint sign-ins. Their pool's workers are joined at
+    interpreter exit, so every way of stopping the server must call this
+    """
+    if SHAREPOINT_AVAILABLE:
+        shutdown_sharepoint()
+
+def load_static_file(path):
+    """
+    Read a dashboard file into a static cache entry:
+    (path, mtime_ns, content type, raw bytes, gzip bytes, ETag, Last-Modified)
+    """
+    # Stat before reading so a write during the read shows up as a newer mtime next time
+    stat = path.stat()
+    data = path.read_bytes()
+    content_type = mimetypes.guess_type(path.name)[0] or 'application/octet-stream'
+    return (path, stat.st_mtime_ns, content_type, data, gzip.compress(data, compresslevel=6),
+            f'W/"{stat.st_mtime_ns:x}-{stat.st_size:x}"',
+            email.utils.formatdate(stat.st_mtime, usegmt=True))
+
+def clear_events_cache():
+    """Drop the cached SharePoint events response"""
+    global _events_inflight
+    with _events_cache_lock:
+        _events_cache.update(ts=0.0, payload=None, payload_gz=None, etag=None,
+                             generation=_events_cache['generation'] + 1)
+        _events_inflight = None
+
+def _load_events_payload(sp_manager, generation, force_refresh=False):
+    """Fetch and encode the events response, caching it unless cleared meanwhile"""
+    events = sp_manager.get_calendar_events(force_refresh=force_refresh)
+    payload = _dumps({
+        'success': True,
+        'events': events,
+        'count': len(events)
+    })
+    etag = f'"{hashlib.sha1(payload).hexdigest()}"'
+    payload_gz = gzip.compress(payload, compresslevel=6) if len(payload) >= _GZIP_MIN_SIZE else None
+
+    with _events_cache_lock:
+        if _events_cache['generation'] == generation:
+            _events_cache.update(ts=time.monotonic(), payload=payload,
+                                 payload_gz=payload_gz, etag=etag)
+    return payload, payload_gz, etag
+
+def fetch_events_payload(sp_manager, force_refresh=False):
+    """Fetch the events response on the SharePoint pool, sharing concurrent fetches"""
+    global _events_inflight
+    with _events_cache_lock:
+        future = _events_inflight
+        if future is None or future.done():
+            future = _sp_pool.submit(_load_events_payload, sp_manager,
+                                     _events_cache['generation'], force_refresh)
+            _events_inflight = future
+    return future.result(timeout=_SP_TIMEOUT)
+
+class ThreadPoolMixIn:
+    """Mix-in that handles requests on a bounded pool of worker threads"""
+
+    max_workers = 16
+
+    def server_activate(self):
+        super().server_activate()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                            thread_name_prefix="ulltra-http")
+        self._active_requests = set()
+        self._active_lock = threading.Lock()
+
+    def process_request(self, request, client_address):
+        with self._active_lock:
+            self._active_requests.add(request)
+        self._executor.submit(self.process_request_thread, request, client_address)
+
+    def process_request_thread(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            with self._active_lock:
+                self._active_requests.discard(request)
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        executor = getattr(self, '_executor', None)
+        if executor is None:
+            return
+        # Pool workers are joined at interpreter exit, so unblock any
+        # worker still reading from an open client connection
+        with self._active_lock:
+            for request in self._active_requests:
+                try:
+                    request.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+        executor.shutdown(wait=False)
+
+class PooledHTTPServer(ThreadPoolMixIn, http.server.HTTPServer):
+    """HTTP server that serves requests from a fixed-size thread pool"""
+
+    # Request path -> load_static_file() entry for the dashboard's static files
+    static_cache = {}
+
+    # On Windows SO_REUSEADDR lets a second socket bind a port already in use
+    allow_reuse_address = os.name != 'nt'
+
+    def server_bind(self):
+        # Skip HTTPServer's reverse DNS lookup (socket.getfqdn) for the loopback address
+        socketserver.TCPServer.server_bind(self)
+        self.server_name, self.server_port = self.server_address[:2]
+
+    def serve_forever(self, poll_interval=0.05):
+        # A short poll interval lets shutdown() return in well under the default 0.5s
+        super().serve_forever(poll_interval)
 
 class CORSHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     """HTTP request handler with CORS support and API endpoints"""
 
+    # API endpoints: request path -> handler method name
+    _GET_ROUTES = {}
+    _POST_ROUTES = {
+        # SharePoint API endpoints
+        '/api/sharepoint/auth/start': 'handle_sharepoint_auth_start',
+        '/api/sharepoint/auth/status': 'handle_sharepoint_auth_status',
+        '/api/sharepoint/auth/logout': 'handle_sharepoint_logout',
+        '/api/sharepoint/events': 'handle_sharepoint_events',
+    }
+
+    # Persistent connections let the dashboard's XHRs share one socket
+    protocol_version = "HTTP/1.1"
+    # Close idle keep-alive connections so they don't pin pool workers
+    timeout = 30
+
     def end_headers(self):
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', '*')
+        # HTTP/0.9 responses have no header buffer
+        if hasattr(self, '_headers_buffer') and not self._is_api_request():
+            self._headers_buffer.append(_CORS_HEADERS)
         super().end_headers()
 
+    def _end_headers_with_body(self, body):
+        """End the headers and send them together with body in a single write"""
+        if not hasattr(self, '_headers_buffer'):
+            self.wfile.write(body)
+            return
+        if not self._is_api_request():
+            self._headers_buffer.append(_CORS_HEADERS)
+        self._headers_buffer.extend((b"\r\n", body))
+        self.flush_headers()
+
+    def _is_api_request(self):
+        """Check whether this request targets an API endpoint (path is unset on malformed requests)"""
+        return getattr(self, 'path', '').startswith('/api/')
+
+    def _is_from_dashboard(self):
+        """
+        Check that a request comes from the dashboard itself: the Host header (guards
+        against DNS rebinding) and any Origin must be this server's loopback address
+        """
+        port = self.server.server_address[1]
+        local_hosts = (f'127.0.0.1:{port}', f'localhost:{port}')
+        if self.headers.get('Host') not in local_hosts:
+            return False
+        origin = self.headers.get('Origin')
+        return origin is None or origin in tuple(f'http://{host}' for host in local_hosts)
+
     def do_OPTIONS(self):
         self.send_response(200)
+        self.send_header('Content-Length', '0')
         self.end_headers()
 
     def log_message(self, format, *args):
         # Suppress HTTP server logs for cleaner output
         return
 
+    def do_GET(self):
+        """Handle GET requests for API endpoints, falling back to static files"""
+        handler = self._GET_ROUTES.get(self.path)
+        if handler:
+            if not self._is_from_dashboard():
+                return self.send_error(403, "Forbidden")
+            return getattr(self, handler)()
+
+        # Serve the dashboard files from memory, precompressed when accepted
+        path = urlparse(self.path).path
+        cached = self.server.static_cache.get(path)
+        if cached:
+            _, _, content_type, body, body_gz, etag, last_modified = self._current_static(path, cached)
+            not_modified = self._not_modified(etag, last_modified)
+            if not_modified:
+                self.send_response(304)
+            else:
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                if self._accepts_gzip():
+                    body = body_gz
+                    self.send_header('Content-Encoding', 'gzip')
+                self.send_header('Content-Length', str(len(body)))
+            self.send_header('Vary', 'Accept-Encoding')
+            self.send_header('ETag', etag)
+            self.send_header('Last-Modified', last_modified)
+            # Let the browser keep its copy but check back each load (a cheap 304)
+            self.send_header('Cache-Control', 'no-cache')
+            if not_modified:
+                self.end_headers()
+            else:
+                self._end_headers_with_body(body)
+            return
+
+        super().do_GET()
+
+    def _current_static(self, path, cached):
+        """Return the cache entry for path, reloading it if the file changed on disk"""
+        try:
+            mtime_ns = cached[0].stat().st_mtime_ns
+        except OSError:
+            # Gone or unreadable; keep serving the copy in memory
+            return cached
+        if mtime_ns != cached[1]:
+            cached = load_static_file(cached[0])
+            self.server.static_cache[path] = cached
+        return cached
+
+    def _not_modified(self, etag, last_modified):
+        """Check the request's conditional headers against a cached file's validators"""
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            # If-None-Match takes precedence; weak comparison is fine for GET
+            tags = [tag.strip() for tag in if_none_match.split(',')]
+            return '*' in tags or etag in tags or etag[2:] in tags
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since is None:
+            return False
+        since = email.utils.parsedate_tz(if_modified_since)
+        if since is None:
+            return False
+        return email.utils.mktime_tz(since) >= email.utils.mktime_tz(email.utils.parsedate_tz(last_modified))
+
+    def _accepts_gzip(self):
+        """Check whether the client accepts gzip-encoded responses"""
+        return 'gzip' in self.headers.get('Accept-Encoding', '')
+
     def do_POST(self):
         """Handle POST requests for API endpoints"""
-        from sharepoint_api import get_sharepoint_manager
-        import json
-
-        # SharePoint API endpoints
-        if self.path == '/api/sharepoint/auth/start':
-            self.handle_sharepoint_auth_start()
-        elif self.path == '/api/sharepoint/auth/status':
-            self.handle_sharepoint_auth_status()
-        elif self.path == '/api/sharepoint/auth/logout':
-            self.handle_sharepoint_logout()
-        elif self.path == '/api/sharepoint/events':
-            self.handle_sharepoint_events()
-        else:
-            self.send_error(404, "Endpoint not found")
+        # Always consume the body so the next request on a persistent
+        # connection starts at the right place in the stream
+        try:
+            content_length = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            # The body can't be located, so the connection can't be reused either
+            self.close_connection = True
+            return self.send_error(400, "Invalid Content-Length")
+        self.request_body = self.rfile.read(content_length) if content_length > 0 else b''
+
+        handler = self._POST_ROUTES.get(self.path)
+        if not handler:
+            return self.send_error(404, "Endpoint not found")
+        if not self._is_from_dashboard():
+            return self.send_error(403, "Forbidden")
+        if not SHAREPOINT_AVAILABLE:
+            return self.send_error(503, "SharePoint integration not available")
+        getattr(self, handler)()
+
+    def _send_json(self, status, obj, extra_headers=()):
+        """Send a JSON response; obj may be pre-encoded bytes"""
+        body = obj if isinstance(obj, bytes) else _dumps(obj)
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in extra_headers:
+            self.send_header(key, value)
+        self._end_headers_with_body(body)
+
+    def _read_json_body(self):
+        """Decode the JSON request body, if any"""
+        if self.request_body:
+            return _loads(self.request_body)
+        return {}
 
     def handle_sharepoint_auth_start(self):
         """Start SharePoint device code authentication"""
-        import json
-        from sharepoint_api import get_sharepoint_manager
-
         try:
             # Read request body for configuration
-            content_length = int(self.headers.get('Content-Length', 0))
-            if content_length > 0:
-                body = self.rfile.read(content_length)
-                config = json.loads(body.decode('utf-8'))
-            else:
-                config = {}
+            config = self._read_json_body()
 
             # Get SharePoint configuration
             site_url = config.get('site_url', 'https://uflorida.sharepoint.com/sites/PRICE')
@@ -88,85 +390,72 @@ class CORSHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
 
             # Start device code flow
             result = sp_manager.start_device_code_flow()
+            clear_events_cache()
 
             # Send response
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(result).encode())
+            self._send_json(200, result)
 
         except Exception as e:
             self.send_error(500, f"Authentication error: {str(e)}")
 
     def handle_sharepoint_auth_status(self):
         """Check SharePoint authentication status"""
-        import json
-        from sharepoint_api import get_sharepoint_manager
-
         try:
             sp_manager = get_sharepoint_manager()
             status = sp_manager.get_auth_status()
-
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(status).encode())
-
         except Exception as e:
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({
-                'authenticated': False,
-                'error': 'Not initialized'
-            }).encode())
+            status = _NOT_INITIALIZED
+
+        self._send_json(200, status)
 
     def handle_sharepoint_logout(self):
         """Logout from SharePoint"""
-        import json
-        from sharepoint_api import get_sharepoint_manager
-
         try:
             sp_manager = get_sharepoint_manager()
             sp_manager.logout()
+            clear_events_cache()
 
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'success': True}).encode())
+            self._send_json(200, _LOGOUT_OK)
 
         except Exception as e:
             self.send_error(500, f"Logout error: {str(e)}")
 
     def handle_sharepoint_events(self):
         """Fetch SharePoint calendar events"""
-        import json
-        from sharepoint_api import get_sharepoint_manager
-
         try:
+            force_refresh = bool(self._read_json_body().get('force_refresh'))
             sp_manager = get_sharepoint_manager()
 
             if not sp_manager.is_authenticated():
-                self.send_response(401)
-                self.send_header('Content-Type', 'application/json')
+                return self._send_json(401, _NOT_AUTHENTICATED)
+
+            with _events_cache_lock:
+                fresh = time.monotonic() - _events_cache['ts'] < _CACHE_TTL
+                if _events_cache['payload'] is not None and fresh and not force_refresh:
+                    payload, payload_gz, etag = (_events_cache['payload'],
+                                                 _events_cache['payload_gz'],
+                                                 _events_cache['etag'])
+                else:
+                    payload = None
+
+            if payload is None:
+                # Fetch events
+                payload, payload_gz, etag = fetch_events_payload(sp_manager, force_refresh)
+
+            if self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
                 self.end_headers()
-                self.wfile.write(json.dumps({
-                    'error': 'Not authenticated'
-                }).encode())
                 return
 
-            # Fetch events
-            events = sp_manager.get_calendar_events()
-
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({
-                'success': True,
-                'events': events,
-                'count': len(events)
-            }).encode())
+            headers = [('Vary', 'Accept-Encoding'), ('ETag', etag)]
+            if payload_gz and self._accepts_gzip():
+                payload = payload_gz
+                headers.append(('Content-Encoding', 'gzip'))
+            self._send_json(200, payload, headers)
 
+        except FutureTimeoutError:
+            self.send_error(504, "Timed out fetching events from SharePoint")
         except Exception as e:
             self.send_error(500, f"Error fetching events: {str(e)}")
 
@@ -174,7 +463,7 @@ class ULLTRADashboard:
     """Main application class for ULLTRA Dashboard"""
     
     def __init__(self):
-        self.port = self.find_free_port()
+        self.port = None
         self.server = None
         self.server_thread = None
         self.root = None
@@ -191,24 +480,20 @@ class ULLTRADashboard:
             
         print(f"Base directory: {self.base_dir}")
         
-    def find_free_port(self, start_port=8000):
-        """Find a free port starting from start_port"""
-        port = start_port
-        while port < start_port + 100:
-            try:
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                    s.bind(('localhost', port))
-                    return port
-            except OSError:
-                port += 1
-        raise Exception("Could not find a free port")
+    def bind_server(self, preferred_port=8000):
+        """Bind the HTTP server to preferred_port, or a kernel-assigned port if it is taken"""
+        # Serve files from base_dir without changing the process working directory
+        handler = functools.partial(CORSHTTPRequestHandler, directory=str(self.base_dir))
+
+        # A stable port keeps the dashboard origin (and its localStorage cache) the same
+        try:
+            return PooledHTTPServer(("127.0.0.1", preferred_port), handler)
+        except OSError:
+            return PooledHTTPServer(("127.0.0.1", 0), handler)
     
     def start_server(self):
         """Start the HTTP server in a separate thread"""
         try:
-            # Change to the base directory where web files are located
-            os.chdir(self.base_dir)
-            
             # Verify web files exist
             required_files = ['index.html', 'styles.css', 'script.js']
             missing_files = [f for f in required_files if not (self.base_dir / f).exists()]
@@ -216,8 +501,14 @@ class ULLTRADashboard:
             if missing_files:
                 raise Exception(f"Missing required files: {', '.join(missing_files)}")
             
+            # Compress the dashboard files once; entries are reloaded if a file changes
+            static_cache = {'/' + f: load_static_file(self.base_dir / f) for f in required_files}
+            static_cache['/'] = static_cache['/index.html']
+
             # Create and start server
-            self.server = socketserver.TCPServer(("127.0.0.1", self.port), CORSHTTPRequestHandler)
+            self.server = self.bind_server()
+            self.server.static_cache = static_cache
+            self.port = self.server.server_address[1]
             self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
             self.server_thread.start()
             self.running = True
@@ -227,17 +518,29 @@ class ULLTRADashboard:
             
         except Exception as e:
             print(f"Error starting server: {e}")
-            if GUI_AVAILABLE:
+            if _gui_available():
+                from tkinter import messagebox
                 messagebox.showerror("Server Error", f"Failed to start server: {e}")
             return False
     
     def stop_server(self):
         """Stop the HTTP server"""
         if self.server:
-            self.server.shutdown()
-            self.server.server_close()
+            server = self.server
+            stopped = threading.Event()
+
+            def shutdown():
+                server.shutdown()
+                server.server_close()
+                stopped.set()
+
+            # Shut down off the calling (GUI) thread and don't wait on it for long
+            threading.Thread(target=shutdown, daemon=True).start()
+            if not stopped.wait(timeout=1.0):
+                print("Server did not stop within 1s; exiting anyway")
             self.running = False
             print("Server stopped")
+        stop_background_work()
     
     def open_dashboard(self):
         """Open the dashboard in the default web browser"""
@@ -247,18 +550,27 @@ class ULLTRADashboard:
             print(f"Dashboard opened: {url}")
         except Exception as e:
             print(f"Error opening browser: {e}")
-            if GUI_AVAILABLE:
+            if _gui_available():
+                from tkinter import messagebox
                 messagebox.showwarning("Browser Error", f"Could not open browser automatically.\nPlease visit: {url}")
     
     def create_tray_icon(self):
         """Create system tray icon"""
-        if not TRAY_AVAILABLE:
+        if not _tray_available():
             return None
-            
-        # Create a simple icon
-        image = Image.new('RGB', (64, 64), color='blue')
-        draw = ImageDraw.Draw(image)
-        draw.text((10, 20), 'U', fill='white', anchor='mm')
+
+        import pystray
+        from PIL import Image
+
+        # Load the bundled icon; only draw one if it wasn't packaged
+        icon_path = self.base_dir / 'tray.png'
+        if icon_path.exists():
+            image = Image.open(icon_path)
+        else:
+            from PIL import ImageDraw
+            image = Image.new('RGB', (64, 64), color='blue')
+            draw = ImageDraw.Draw(image)
+            draw.text((10, 20), 'U', fill='white', anchor='mm')
         
         # Create menu
         menu = pystray.Menu(
@@ -274,9 +586,12 @@ class ULLTRADashboard:
     
     def create_gui(self):
         """Create the main GUI window"""
-        if not GUI_AVAILABLE:
+        if not _gui_available():
             return None
-            
+
+        import tkinter as tk
+        import tkinter.ttk as ttk
+
         self.root = tk.Tk()
         self.root.title("ULLTRA Study Dashboard")
         self.root.geometry("400x300")
@@ -316,7 +631,7 @@ class ULLTRADashboard:
         self.open_btn.pack(side=tk.LEFT, padx=(0, 10))
         
         # Minimize to tray button (if available)
-        if TRAY_AVAILABLE:
+        if self.tray:
             self.minimize_btn = ttk.Button(button_frame, text="Minimize to Tray", 
                                           command=self.minimize_to_tray, width=15)
             self.minimize_btn.pack(side=tk.LEFT, padx=(0, 10))
@@ -362,7 +677,7 @@ class ULLTRADashboard:
     
     def on_window_close(self):
         """Handle window close event"""
-        if TRAY_AVAILABLE and self.tray:
+        if self.tray:
             # Minimize to tray instead of closing
             self.minimize_to_tray()
         else:
@@ -391,18 +706,16 @@ class ULLTRADashboard:
             print("Failed to start server. Exiting.")
             return
         
-        self.update_status("Running", f"http://127.0.0.1:{self.port}")
-        
-        # Create system tray icon
-        if TRAY_AVAILABLE:
-            self.tray = self.create_tray_icon()
-        
         # Create GUI if available
-        if GUI_AVAILABLE:
+        if _gui_available():
+            # Create system tray icon (only shown alongside the GUI)
+            self.tray = self.create_tray_icon()
             self.root = self.create_gui()
+            self.update_status("Running", f"http://127.0.0.1:{self.port}")
             
-            # Auto-open dashboard after a short delay
-            self.root.after(1000, self.open_dashboard)
+            # The listening socket is already bound, so open the dashboard
+            # as soon as the window has been drawn
+            self.root.after_idle(self.open_dashboard)
             
             # Start tray icon in separate thread if available
             if self.tray:
@@ -419,8 +732,10 @@ class ULLTRADashboard:
             self.open_dashboard()
             print("Press Ctrl+C to stop the server")
             try:
-                while self.running:
-                    threading.Event().wait(1)
+                # Sleep until serve_forever returns (stop_server) or Ctrl+C; the
+                # timeout matters on Windows, where an untimed join can't be interrupted
+                while self.server_thread.is_alive():
+                    self.server_thread.join(timeout=1.0)
             except KeyboardInterrupt:
                 pass
         
@@ -433,11 +748,17 @@ def main():
         app = ULLTRADashboard()
         app.run()
     except Exception as e:
-        print(f"Application error: {e}")
-        if GUI_AVAILABLE:
-            root = tk.Tk()
-            root.withdraw()
-            messagebox.showerror("Application Error", f"An error occurred: {e}")
+        print(f"Application error: {e}", file=sys.stderr)
+        # Only start a Tcl interpreter when there is an error to show
+        if _gui_available():
+            from tkinter import Tk, TclError, messagebox
+            try:
+                root = Tk()
+                root.withdraw()
+                messagebox.showerror("Application Error", f"An error occurred: {e}")
+                root.destroy()
+            except TclError:
+                pass  # No display available; the error was printed above
         sys.exit(1)
 
 if __name__ == "__main__":
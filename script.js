@@ -6550,6 +6550,17 @@ class SharePointCalendarManager {
                 return;
             }
 
+            // Signed in silently from the saved token cache - no device code needed
+            if (result.authenticated) {
+                this.isAuthenticated = true;
+                if (result.message) {
+                    console.log('[SharePoint]', result.message);
+                }
+                this.updateConnectionStatus();
+                this.loadCalendarEvents();
+                return;
+            }
+
             // Display device code instructions
             this.displayDeviceCodeInstructions(result);
 
@@ -6741,7 +6752,7 @@ class SharePointCalendarManager {
 
         try {
             // Fetch calendar events from SharePoint via Microsoft Graph API
-            const events = await this.fetchSharePointEvents();
+            const events = await this.fetchSharePointEvents(forceRefresh);
             this.events = events;
             this.lastSync = Date.now();
             this.updateConnectionStatus();
@@ -6754,12 +6765,13 @@ class SharePointCalendarManager {
         }
     }
 
-    async fetchSharePointEvents() {
+    async fetchSharePointEvents(forceRefresh = false) {
         try {
-            // Fetch events from Python backend
+            // Fetch events from Python backend (served from its short-lived cache unless forced)
             const response = await fetch('/api/sharepoint/events', {
                 method: 'POST',
-                headers: { 'Content-Type': 'application/json' }
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ force_refresh: forceRefresh })
             });
 
             if (response.status === 401) {
@@ -6826,7 +6838,8 @@ class SharePointCalendarManager {
     groupEventsByDate(events) {
         const grouped = {};
         events.forEach(event => {
-            const date = event.date || event.EventDate || event.Start;
+            // date is ISO 8601 when the server could parse it; otherwise fall back to the raw value
+            const date = event.date || event.date_iso || event.EventDate || event.Start;
             const dateKey = new Date(date).toDateString();
             if (!grouped[dateKey]) {
                 grouped[dateKey] = [];
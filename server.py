@@ -4,30 +4,21 @@ Simple HTTP server for the ULLTRA dashboard
 Run this to avoid CORS issues when testing locally
 """
 
-import http.server
-import socketserver
 import webbrowser
-import os
+import functools
 from pathlib import Path
 
-PORT = 8000
-
-class CORSHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
-    def end_headers(self):
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', '*')
-        super().end_headers()
+# Reuse the desktop app's handler so the SharePoint API endpoints work here too
+from app import CORSHTTPRequestHandler, PooledHTTPServer, stop_background_work
 
-    def do_OPTIONS(self):
-        self.send_response(200)
-        self.end_headers()
+PORT = 8000
 
 def main():
-    # Change to the directory containing this script
-    os.chdir(Path(__file__).parent)
-    
-    with socketserver.TCPServer(("", PORT), CORSHTTPRequestHandler) as httpd:
+    # Serve the directory containing this script
+    handler = functools.partial(CORSHTTPRequestHandler, directory=str(Path(__file__).parent))
+
+    # Loopback only: the SharePoint endpoints must not be reachable from the network
+    with PooledHTTPServer(("127.0.0.1", PORT), handler) as httpd:
         print(f"ULLTRA Dashboard Server")
         print(f"Serving at http://localhost:{PORT}")
         print(f"Open your browser to: http://localhost:{PORT}")
@@ -39,7 +30,11 @@ def main():
         except:
             pass
             
-        httpd.serve_forever()
+        try:
+            httpd.serve_forever()
+        finally:
+            # A pending sign-in would otherwise hold up exit until its code expires
+            stop_background_work()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
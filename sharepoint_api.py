@@ -4,18 +4,93 @@ Uses OAuth2 Device Code Flow for authentication
 """
 
 import json
+import operator
 import threading
+import time
+import uuid
+from types import MappingProxyType
+from dataclasses import dataclass
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote, urlparse
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple, Iterator
 
+# Streaming JSON parser for large list responses (optional)
 try:
-    from office365.sharepoint.client_context import ClientContext
-    import msal
-    OFFICE365_AVAILABLE = True
+    import ijson
 except ImportError:
-    OFFICE365_AVAILABLE = False
-    print("Warning: Office365-REST-Python-Client not installed. SharePoint integration disabled.")
+    ijson = None
 
+# The client libraries are slow to import, so they're loaded on first sign-in.
+# None until the import has been attempted
+SHAREPOINT_LIBS_AVAILABLE: Optional[bool] = None
+
+
+def _lazy_sharepoint_libs() -> bool:
+    """Import the SharePoint client libraries on first use; returns whether they are available"""
+    global msal, requests, HTTPAdapter, SHAREPOINT_LIBS_AVAILABLE
+    if SHAREPOINT_LIBS_AVAILABLE is None:
+        try:
+            import msal
+            import requests
+            from requests.adapters import HTTPAdapter
+            SHAREPOINT_LIBS_AVAILABLE = True
+        except ImportError:
+            SHAREPOINT_LIBS_AVAILABLE = False
+            print("Warning: msal or requests not installed. SharePoint integration disabled.")
+    return SHAREPOINT_LIBS_AVAILABLE
+
+# Common SharePoint list field mappings: candidate columns for each event
+# field, in priority order. Adjust these based on your actual column names
+PARTICIPANT_KEYS = ('Participant', 'ParticipantID', 'Subject')
+DATE_KEYS = ('EventDate', 'StartDate', 'Date')
+TIME_KEYS = ('EventTime', 'Time')
+TYPE_KEYS = ('Category', 'EventType', 'Type')
+DESCRIPTION_KEYS = ('Description', 'Notes', 'Body')
+
+# Columns copied straight across, with their defaults when missing
+PLAIN_DEFAULTS = {'ID': None, 'Title': '', 'Location': '', 'Status': ''}
+_plain_fields = operator.itemgetter(*PLAIN_DEFAULTS)
+
+
+def _parse_date(value: Any) -> Optional[datetime]:
+    """Parse a SharePoint ISO 8601 date ('2024-01-15T00:00:00Z'); None if missing or not ISO"""
+    if not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
+@dataclass
+class CalendarEvent:
+    """A calendar entry from the SharePoint list, in the dashboard's field names"""
+    # Declared by hand (not dataclass(slots=True)) to keep Python 3.8 support
+    __slots__ = ('id', 'title', 'participant', 'date', 'date_iso', 'time',
+                 'type', 'description', 'location', 'status')
+
+    id: Any
+    title: str
+    participant: str
+    date: Optional[datetime]
+    date_iso: Optional[str]
+    time: str
+    type: str
+    description: str
+    location: str
+    status: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict for JSON encoders that don't handle dataclasses"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _event_sort_key(event: CalendarEvent):
+    """Chronological order, undated events last"""
+    date = event.date
+    return (date is None, date.timestamp() if date else 0.0)
 
 class SharePointManager:
     """Manages SharePoint authentication and data access"""
@@ -24,91 +99,161 @@ class SharePointManager:
     CLIENT_ID = "d3590ed6-52b3-4102-aeff-aad2292ab01c"
     TENANT_ID = "common"  # Works across all Microsoft 365 tenants
 
+    # Status before sign-in. auth_status is a read-only snapshot that is only ever
+    # replaced as a whole, so readers on other threads never see a half-updated status
+    SIGNED_OUT_STATUS = MappingProxyType({
+        'authenticated': False,
+        'device_code': None,
+        'user_code': None,
+        'verification_url': None,
+        'message': None,
+        'expires_in': None,
+        'error': None
+    })
+
+    # MSAL token cache kept between runs so restarts can sign in without a device code.
+    # Encrypted by msal-extensions (DPAPI on Windows); not persisted without it
+    TOKEN_CACHE_PATH = Path.home() / '.ulltra' / 'spcache.bin'
+
+    # Renew the access token in the background once it is this close to expiry
+    REFRESH_WINDOW = timedelta(minutes=5)
+    # After a refresh fails for a temporary reason (network, server), wait this long before retrying
+    REFRESH_RETRY_DELAY = timedelta(seconds=30)
+    # Token endpoint errors that may clear up by themselves; any other error means the
+    # refresh token is no longer usable and the user has to sign in again
+    TRANSIENT_TOKEN_ERRORS = frozenset({'temporarily_unavailable', 'server_error'})
+
+    # Seconds to wait on a SharePoint REST call
+    REQUEST_TIMEOUT = 30
+
+    # List columns read by _transform_list_item_to_event
+    EVENT_FIELDS = (("ID", "Title") + PARTICIPANT_KEYS + DATE_KEYS + TIME_KEYS
+                    + TYPE_KEYS + DESCRIPTION_KEYS + ("Location", "Status"))
+    # Column types SharePoint won't return from a plain $select (lookups and people
+    # need $expand, computed columns may be rejected); naming one fails the whole query
+    UNSELECTABLE_FIELD_TYPES = frozenset({'Lookup', 'LookupMulti', 'User', 'UserMulti', 'Computed'})
+    # SharePoint's list view threshold; one page covers the calendar
+    MAX_ITEMS = 5000
+
+    # Serve cached events for this long; up to twice this long while refreshing in the background
+    EVENTS_TTL = timedelta(minutes=5)
+
+    # HTTP session shared by all managers so TLS connections are reused
+    _session = None
+    _session_lock = threading.Lock()
+
     def __init__(self, site_url: str, list_name: str):
         self.site_url = site_url
         self.list_name = list_name
-        self.ctx: Optional[ClientContext] = None
-        self.auth_status = {
-            'authenticated': False,
-            'device_code': None,
-            'user_code': None,
-            'verification_url': None,
-            'message': None,
-            'expires_in': None,
-            'error': None
-        }
+        # The token is used against the site's REST API, so request a SharePoint audience
+        self.scopes = [f"https://{urlparse(site_url).netloc}/AllSites.Read"]
+        self.auth_status = self.SIGNED_OUT_STATUS
+        self._status_lock = threading.Lock()
         self.access_token = None
         self.token_expires_at = None
 
+        # EVENT_FIELDS present in the list, looked up on the first fetch
+        self._select_fields: Optional[List[str]] = None
+        self._schema_lock = threading.Lock()
+        # Candidate columns for each event field, narrowed to those the list actually has
+        self._event_keys = {
+            'participant': PARTICIPANT_KEYS,
+            'date': DATE_KEYS,
+            'time': TIME_KEYS,
+            'type': TYPE_KEYS,
+            'description': DESCRIPTION_KEYS,
+        }
+
+        # Last fetched events and when they were fetched (UTC)
+        self._events_cache: Optional[Tuple[List[CalendarEvent], datetime]] = None
+        self._events_generation = 0  # bumped on logout so in-flight fetches aren't cached
+        self._events_refreshing = False
+        self._events_lock = threading.Lock()
+
+        # MSAL state kept for silent token refresh; the app (and its token cache) lives as long as the manager
+        self._msal_app = None
+        self._account = None
+        self._token_lock = threading.Lock()
+        self._refreshing = False
+        self._refresh_lock = threading.Lock()  # one token refresh at a time
+        self._refresh_retry_at: Optional[datetime] = None
+
+        # Pending device code sign-in, the response it was started with, and its cancel flag
+        self._auth_future = None
+        self._auth_response: Optional[Dict[str, Any]] = None
+        self._auth_cancel = threading.Event()
+
     def start_device_code_flow(self) -> Dict[str, Any]:
         """
         Initiate device code flow authentication.
         Returns device code info for user to complete authentication.
         """
-        if not OFFICE365_AVAILABLE:
+        if not _lazy_sharepoint_libs():
             return {
                 'success': False,
-                'error': 'Office365-REST-Python-Client library not installed. Run: pip install Office365-REST-Python-Client'
+                'error': 'msal and requests libraries not installed. Run: pip install msal requests'
             }
 
+        # A sign-in is already waiting on the user; hand back the same code
+        if (self._auth_future and not self._auth_future.done()
+                and not self._auth_cancel.is_set()):
+            return self._auth_response
+
         try:
             # Use MSAL directly to get device code
-            app = msal.PublicClientApplication(
-                client_id=self.CLIENT_ID,
-                authority=f"https://login.microsoftonline.com/{self.TENANT_ID}"
-            )
+            app = self._get_msal_app()
+
+            # An account cached by an earlier run can usually sign in without the user;
+            # the cache may also hold accounts whose refresh tokens no longer work
+            for account in app.get_accounts():
+                result = app.acquire_token_silent(self.scopes, account=account)
+                if result and "access_token" in result:
+                    self._complete_sign_in(result, account)
+                    _auth_executor.submit(self._preload_list_schema)
+                    return {
+                        'success': True,
+                        'authenticated': True,
+                        'message': self.auth_status['message']
+                    }
 
             # Initiate device flow - this returns the device code info
-            flow = app.initiate_device_flow(scopes=["https://graph.microsoft.com/.default"])
+            flow = app.initiate_device_flow(scopes=self.scopes)
 
             if "user_code" not in flow:
                 raise Exception("Failed to create device flow")
 
             # Store device code info
-            self.auth_status['user_code'] = flow['user_code']
-            self.auth_status['device_code'] = flow['device_code']
-            self.auth_status['verification_url'] = flow['verification_uri']
-            self.auth_status['message'] = flow['message']
-            self.auth_status['expires_in'] = flow.get('expires_in', 900)
+            self._update_auth_status(
+                user_code=flow['user_code'],
+                device_code=flow['device_code'],
+                verification_url=flow['verification_uri'],
+                message=flow['message'],
+                expires_in=flow.get('expires_in', 900),
+                error=None)
 
             # Start authentication in background thread
+            cancel = self._auth_cancel = threading.Event()
+
             def authenticate():
                 try:
                     # Wait for user to authenticate
-                    result = app.acquire_token_by_device_flow(flow)
+                    result = self._poll_device_flow(app, flow, cancel)
+                    if result is None:
+                        return
 
                     if "access_token" in result:
-                        # Now use the token with Office365 library
-                        self.access_token = result['access_token']
-
-                        # Create SharePoint context with the token
-                        self.ctx = ClientContext(self.site_url)
-                        self.ctx.with_access_token(lambda: result['access_token'])
-
-                        # Test connection
-                        web = self.ctx.web
-                        self.ctx.load(web)
-                        self.ctx.execute_query()
-
-                        self.auth_status['authenticated'] = True
-                        self.auth_status['message'] = f'Successfully connected to: {web.properties.get("Title", "SharePoint")}'
-                        print(f"[SharePoint] Authentication successful")
+                        self._complete_sign_in(result, self._account_for(app, result))
+                        self._preload_list_schema()
                     else:
                         error_msg = result.get('error_description', 'Authentication failed')
-                        self.auth_status['authenticated'] = False
-                        self.auth_status['error'] = error_msg
+                        self._update_auth_status(authenticated=False, error=error_msg)
                         print(f"[SharePoint] Authentication failed: {error_msg}")
 
                 except Exception as e:
-                    self.auth_status['authenticated'] = False
-                    self.auth_status['error'] = str(e)
+                    self._update_auth_status(authenticated=False, error=str(e))
                     print(f"[SharePoint] Authentication failed: {e}")
 
-            # Start authentication in background
-            auth_thread = threading.Thread(target=authenticate, daemon=True)
-            auth_thread.start()
-
-            return {
+            self._auth_response = {
                 'success': True,
                 'user_code': flow['user_code'],
                 'device_code': flow['device_code'],
@@ -124,40 +269,227 @@ class SharePointManager:
                 ]
             }
 
+            # Wait for the sign-in on the shared auth pool
+            self._auth_future = _auth_executor.submit(authenticate)
+            return self._auth_response
+
         except Exception as e:
             return {
                 'success': False,
                 'error': str(e)
             }
 
+    def _complete_sign_in(self, result: Dict[str, Any], account: Optional[Dict[str, Any]]):
+        """Store a freshly acquired token and mark the manager as connected"""
+        self._set_token(result)
+        self._account = account
+
+        # Acquiring the token already proves the sign-in worked,
+        # so skip the extra test query against the site
+        username = (result.get('id_token_claims', {}).get('preferred_username')
+                    or (account or {}).get('username'))
+        self._update_auth_status(
+            authenticated=True,
+            message=(f'Successfully connected to SharePoint as {username}'
+                     if username else 'Successfully connected to SharePoint'))
+        print(f"[SharePoint] Authentication successful")
+
+    @staticmethod
+    def _account_for(app, result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """The cached MSAL account that a token result was issued to"""
+        username = result.get('id_token_claims', {}).get('preferred_username')
+        accounts = app.get_accounts(username=username) if username else []
+        return accounts[0] if accounts else None
+
+    def _preload_list_schema(self):
+        """
+        Look up the list's columns while the user returns to the dashboard,
+        so the first events fetch is a single request
+        """
+        try:
+            self._load_list_schema()
+        except Exception as e:
+            print(f"[SharePoint] Could not preload list columns: {e}")
+
+    def _get_msal_app(self):
+        """Return this manager's MSAL app, creating it (and opening the saved token cache) on first sign-in"""
+        if self._msal_app is None:
+            self._msal_app = msal.PublicClientApplication(
+                client_id=self.CLIENT_ID,
+                authority=f"https://login.microsoftonline.com/{self.TENANT_ID}",
+                token_cache=self._build_token_cache()
+            )
+        return self._msal_app
+
+    def _build_token_cache(self):
+        """
+        MSAL token cache persisted to TOKEN_CACHE_PATH, encrypted with the OS's
+        user-scoped store; it saves itself whenever it changes.
+        Refresh tokens are never written in plaintext: without msal-extensions
+        (or an OS store it can use) the cache is kept in memory only
+        """
+        try:
+            from msal_extensions import build_encrypted_persistence, PersistedTokenCache
+        except ImportError:
+            print("[SharePoint] msal-extensions not installed; sign-in won't be remembered between runs")
+            return msal.SerializableTokenCache()
+        try:
+            return PersistedTokenCache(build_encrypted_persistence(str(self.TOKEN_CACHE_PATH)))
+        except Exception as e:
+            print(f"[SharePoint] Encrypted token storage unavailable; sign-in won't be remembered: {e}")
+            return msal.SerializableTokenCache()
+
+    @staticmethod
+    def _poll_device_flow(app, flow: Dict[str, Any], cancel: threading.Event) -> Optional[Dict[str, Any]]:
+        """
+        Poll the token endpoint at the interval the device flow asks for.
+        Returns the final MSAL result, or None if cancelled.
+        """
+        interval = flow.get('interval', 5)
+        while True:
+            # exit_condition makes MSAL poll exactly once and return
+            result = app.acquire_token_by_device_flow(flow, exit_condition=lambda f: True)
+            error = result.get('error')
+            if error == 'slow_down':
+                interval += 5
+            elif error != 'authorization_pending':
+                return result
+            if flow.get('expires_at', 0) < time.time():
+                return result
+            if cancel.wait(interval):
+                return None
+
+    def _set_token(self, result: Dict[str, Any]):
+        """Store an MSAL access token and when it expires"""
+        with self._token_lock:
+            self.access_token = result['access_token']
+            # Treat the token as expired a minute early to avoid using it at the edge
+            self.token_expires_at = datetime.utcnow() + timedelta(
+                seconds=int(result.get('expires_in', 3599)) - 60)
+
+    def _maybe_refresh_token(self):
+        """
+        Renew the token before it expires: in the background while it is still valid,
+        inline once it has expired (e.g. after the laptop slept) so callers aren't told
+        the user is signed out when a silent refresh would work
+        """
+        expires_at = self.token_expires_at
+        if self._msal_app is None or self._account is None or expires_at is None:
+            return
+        now = datetime.utcnow()
+        remaining = expires_at - now
+        if remaining > self.REFRESH_WINDOW:
+            return
+        retry_at = self._refresh_retry_at
+        if retry_at is not None and now < retry_at:
+            return
+        if remaining <= timedelta(0):
+            self._refresh_token()
+            return
+
+        with self._token_lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._background_refresh, daemon=True).start()
+
+    def _background_refresh(self):
+        """Run _refresh_token on a background thread"""
+        try:
+            self._refresh_token()
+        finally:
+            with self._token_lock:
+                self._refreshing = False
+
+    def _refresh_token(self):
+        """Renew the access token silently using MSAL's refresh token"""
+        with self._refresh_lock:
+            account = self._account
+            expires_at = self.token_expires_at
+            if account is None or expires_at is None:
+                return
+            # Another thread may have renewed it while we waited
+            if expires_at - datetime.utcnow() > self.REFRESH_WINDOW:
+                return
+            try:
+                # force_refresh: MSAL would otherwise hand back the nearly expired cached token
+                result = self._msal_app.acquire_token_silent(
+                    self.scopes, account=account, force_refresh=True)
+            except Exception as e:
+                # Network trouble: try again later rather than on every status check
+                self._refresh_retry_at = datetime.utcnow() + self.REFRESH_RETRY_DELAY
+                print(f"[SharePoint] Token refresh failed: {e}")
+                return
+
+            if result and "access_token" in result:
+                self._refresh_retry_at = None
+                # Don't bring back a token for an account that signed out meanwhile
+                if self._account is account:
+                    self._set_token(result)
+                    print("[SharePoint] Access token refreshed")
+                return
+
+            error_msg = (result or {}).get('error_description', 'No cached account')
+            print(f"[SharePoint] Token refresh failed: {error_msg}")
+            if result and result.get('error') in self.TRANSIENT_TOKEN_ERRORS:
+                self._refresh_retry_at = datetime.utcnow() + self.REFRESH_RETRY_DELAY
+            elif self._account is account:
+                self._end_expired_session(account)
+
+    def _end_expired_session(self, account: Dict[str, Any]):
+        """Sign out after the refresh token stopped working, so the user is asked to sign in again"""
+        self._account = None
+        self.access_token = None
+        self.token_expires_at = None
+        self._refresh_retry_at = None
+        # Don't let the next sign-in try the dead account silently again
+        self._msal_app.remove_account(account)
+        self._update_auth_status(authenticated=False,
+                                 message='SharePoint session expired - please sign in again')
+
+    def _update_auth_status(self, **changes):
+        """Publish a new auth status snapshot with the given fields changed"""
+        with self._status_lock:
+            self.auth_status = MappingProxyType({**self.auth_status, **changes})
+
     def get_auth_status(self) -> Dict[str, Any]:
         """Get current authentication status"""
+        # Read every field from the same snapshot
+        status = self.auth_status
         return {
-            'authenticated': self.auth_status['authenticated'],
-            'message': self.auth_status['message'],
-            'error': self.auth_status['error']
+            'authenticated': self._is_authenticated(status),
+            'message': status['message'],
+            'error': status['error']
         }
 
     def is_authenticated(self) -> bool:
-        """Check if currently authenticated"""
-        return self.ctx is not None and self.auth_status['authenticated']
+        """Check if currently authenticated with an unexpired token"""
+        return self._is_authenticated(self.auth_status)
+
+    def _is_authenticated(self, status) -> bool:
+        """is_authenticated against a given auth status snapshot"""
+        self._maybe_refresh_token()
+        return (self.access_token is not None
+                and status['authenticated']
+                and self.token_expires_at is not None
+                and datetime.utcnow() < self.token_expires_at)
 
     def logout(self):
         """Clear authentication"""
-        self.ctx = None
+        self._auth_cancel.set()
         self.access_token = None
         self.token_expires_at = None
-        self.auth_status = {
-            'authenticated': False,
-            'device_code': None,
-            'user_code': None,
-            'verification_url': None,
-            'message': None,
-            'expires_in': None,
-            'error': None
-        }
-
-    def get_calendar_events(self) -> List[Dict[str, Any]]:
+        if self._msal_app is not None and self._account is not None:
+            # Forget the signed-out account's cached tokens, on disk too
+            self._msal_app.remove_account(self._account)
+        self._account = None
+        with self._events_lock:
+            self._events_cache = None
+            self._events_generation += 1
+        with self._status_lock:
+            self.auth_status = self.SIGNED_OUT_STATUS
+
+    def get_calendar_events(self, force_refresh: bool = False) -> List[CalendarEvent]:
         """
         Fetch calendar events from SharePoint list
         Returns list of events with standardized field names
@@ -165,73 +497,236 @@ class SharePointManager:
         if not self.is_authenticated():
             raise Exception("Not authenticated. Please authenticate first.")
 
+        cached = self._events_cache
+        if cached and not force_refresh:
+            events, fetched_at = cached
+            age = datetime.utcnow() - fetched_at
+            if age < self.EVENTS_TTL:
+                return events
+            if age < 2 * self.EVENTS_TTL:
+                # Stale but recent: serve it now and refresh in the background
+                self._refresh_events_in_background()
+                return events
+
+        return self._fetch_calendar_events()
+
+    def _refresh_events_in_background(self):
+        """Re-fetch events on a daemon thread unless a refresh is already running"""
+        with self._events_lock:
+            if self._events_refreshing:
+                return
+            self._events_refreshing = True
+
+        def refresh():
+            try:
+                self._fetch_calendar_events()
+            except Exception as e:
+                print(f"[SharePoint] Background refresh failed: {e}")
+            finally:
+                with self._events_lock:
+                    self._events_refreshing = False
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def _fetch_calendar_events(self) -> List[CalendarEvent]:
+        """Fetch events from SharePoint and update the cache"""
+        generation = self._events_generation
         try:
-            # Get the list
-            target_list = self.ctx.web.lists.get_by_title(self.list_name)
+            self._load_list_schema()
 
-            # Fetch list items
-            items = target_list.items
-            self.ctx.load(items)
-            self.ctx.execute_query()
+            # Only fetch the mapped columns
+            items = self._iter_rest_items(
+                f"{self._list_path}/items?$select={','.join(self._select_fields)}&$top={self.MAX_ITEMS}")
 
-            # Transform items to calendar events
-            events = []
-            for item in items:
-                try:
-                    event = self._transform_list_item_to_event(item)
-                    if event:
-                        events.append(event)
-                except Exception as e:
-                    print(f"Error transforming item: {e}")
-                    continue
-
-            return events
+            # Transform items to calendar events as they arrive, skipping malformed entries
+            transform = self._transform_list_item_to_event
+            events = [transform(item) for item in items if item and isinstance(item, dict)]
+            events.sort(key=_event_sort_key)
 
         except Exception as e:
             raise Exception(f"Failed to fetch calendar events: {str(e)}")
 
-    def _transform_list_item_to_event(self, item) -> Optional[Dict[str, Any]]:
+        with self._events_lock:
+            if self._events_generation == generation:
+                self._events_cache = (events, datetime.utcnow())
+        return events
+
+    @property
+    def _list_path(self) -> str:
+        """REST path of the calendar list; list titles are OData string literals, so quotes are doubled"""
+        list_title = quote(self.list_name.replace("'", "''"))
+        return f"web/lists/getByTitle('{list_title}')"
+
+    def _load_list_schema(self):
+        """
+        Look up the site title and the list's columns, once per manager.
+        $select must only name plain columns that exist, or SharePoint rejects the query
+        """
+        if self._select_fields is not None:
+            return
+        with self._schema_lock:
+            if self._select_fields is not None:
+                return
+            # Both lookups in one round trip
+            web, fields = self._batch_get([
+                "web?$select=Title",
+                f"{self._list_path}/fields?$select=InternalName,TypeAsString",
+            ])
+            if web and web.get('Title'):
+                self._update_auth_status(message=f'Successfully connected to: {web["Title"]}')
+            available = {field['InternalName'] for field in fields.get('value', [])
+                         if field.get('TypeAsString') not in self.UNSELECTABLE_FIELD_TYPES}
+            self._event_keys = {field: tuple(k for k in keys if k in available)
+                                for field, keys in self._event_keys.items()}
+            self._select_fields = [f for f in self.EVENT_FIELDS if f in available]
+
+    @classmethod
+    def _get_session(cls):
+        """Return the shared keep-alive HTTP session, creating it on first use"""
+        with cls._session_lock:
+            if cls._session is None:
+                session = requests.Session()
+                session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=2))
+                cls._session = session
+            return cls._session
+
+    @property
+    def _api_root(self) -> str:
+        return f"{self.site_url.rstrip('/')}/_api/"
+
+    def _iter_rest_items(self, url: str) -> Iterator[Dict[str, Any]]:
+        """
+        GET a collection relative to {site_url}/_api/ and yield its items.
+        With ijson installed the body is parsed as it downloads instead of all at once
+        """
+        response = self._get_session().get(
+            f"{self._api_root}{url}",
+            headers={
+                'Authorization': f'Bearer {self.access_token}',
+                'Accept': 'application/json;odata=nometadata',
+            },
+            timeout=self.REQUEST_TIMEOUT,
+            stream=ijson is not None,
+        )
+        with response:
+            response.raise_for_status()
+            if ijson is None:
+                yield from response.json().get('value', [])
+            else:
+                # Let urllib3 undo any gzip transfer encoding before ijson reads the stream
+                response.raw.decode_content = True
+                yield from ijson.items(response.raw, 'value.item', use_float=True)
+
+    def _batch_get(self, urls: List[str]) -> List[Any]:
+        """
+        Run several GET requests against the site's REST API in one $batch call.
+        urls are relative to {site_url}/_api/; returns the decoded JSON bodies in order.
+        """
+        api_root = self._api_root
+        boundary = f"batch_{uuid.uuid4()}"
+
+        # One application/http part per GET; read-only batches need no changesets
+        lines = []
+        for url in urls:
+            lines += [
+                f"--{boundary}",
+                "Content-Type: application/http",
+                "Content-Transfer-Encoding: binary",
+                "",
+                f"GET {api_root}{url} HTTP/1.1",
+                "Accept: application/json;odata=nometadata",
+                "",
+            ]
+        lines += [f"--{boundary}--", ""]
+
+        response = self._get_session().post(
+            f"{api_root}$batch",
+            data="\r\n".join(lines).encode('utf-8'),
+            headers={
+                'Authorization': f'Bearer {self.access_token}',
+                'Content-Type': f'multipart/mixed; boundary={boundary}',
+                'Accept': 'application/json',
+            },
+            timeout=self.REQUEST_TIMEOUT,
+        )
+        response.raise_for_status()
+        return self._parse_batch_response(response)
+
+    @staticmethod
+    def _parse_batch_response(response) -> List[Any]:
+        """Split a multipart $batch response into the decoded JSON body of each part"""
+        content_type = response.headers.get('Content-Type', '')
+        boundary = content_type.split('boundary=', 1)[1].split(';', 1)[0].strip('"')
+        text = response.text.replace('\r\n', '\n')
+
+        results = []
+        for part in text.split(f"--{boundary}")[1:]:
+            if part.startswith('--'):
+                break
+            # Each part: MIME headers, blank line, HTTP status line and headers, blank line, body
+            _, _, http_message = part.partition('\n\n')
+            status_line, _, rest = http_message.partition('\n')
+            _, _, body = rest.partition('\n\n')
+            status = int(status_line.split()[1])
+            if status >= 400:
+                raise Exception(f"Batch request failed ({status_line.strip()}): {body.strip()[:200]}")
+            results.append(json.loads(body) if body.strip() else None)
+
+        return results
+
+    def _transform_list_item_to_event(self, properties: Dict[str, Any]) -> CalendarEvent:
         """
         Transform SharePoint list item to standardized event format
         Adjust field mappings based on your actual SharePoint list structure
+        Expects a non-empty dict; the caller filters out anything else
         """
-        try:
-            properties = item.properties
-
-            # Common SharePoint list field mappings
-            # Adjust these based on your actual column names
-            event = {
-                'id': properties.get('ID'),
-                'title': properties.get('Title', ''),
-                'participant': properties.get('Participant') or properties.get('ParticipantID') or properties.get('Subject', ''),
-                'date': properties.get('EventDate') or properties.get('StartDate') or properties.get('Date'),
-                'time': properties.get('EventTime') or properties.get('Time', ''),
-                'type': properties.get('Category') or properties.get('EventType') or properties.get('Type', 'general'),
-                'description': properties.get('Description') or properties.get('Notes') or properties.get('Body', ''),
-                'location': properties.get('Location', ''),
-                'status': properties.get('Status', ''),
-                # Keep all raw properties for debugging
-                'raw': properties
-            }
-
-            return event
-
-        except Exception as e:
-            print(f"Error transforming item: {e}")
-            return None
+        get = properties.get
+        keys = self._event_keys
+        item_id, title, location, status = _plain_fields({**PLAIN_DEFAULTS, **properties})
+        raw_date = next(filter(None, map(get, keys['date'])), None)
+
+        # First non-empty value among each field's candidate columns
+        return CalendarEvent(
+            id=item_id,
+            title=title,
+            participant=next(filter(None, map(get, keys['participant'])), ''),
+            date=_parse_date(raw_date),
+            date_iso=raw_date,
+            time=next(filter(None, map(get, keys['time'])), ''),
+            type=next(filter(None, map(get, keys['type'])), 'general'),
+            description=next(filter(None, map(get, keys['description'])), ''),
+            location=location,
+            status=status,
+        )
 
 
 # Global SharePoint manager instance
 _sharepoint_manager: Optional[SharePointManager] = None
+_sharepoint_manager_lock = threading.Lock()
+
+# Small fixed pool that waits on device code sign-ins
+_auth_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='sp-auth')
 
 
 def get_sharepoint_manager(site_url: str = None, list_name: str = None) -> SharePointManager:
     """Get or create SharePoint manager instance"""
     global _sharepoint_manager
 
-    if _sharepoint_manager is None:
-        if not site_url or not list_name:
-            raise ValueError("SharePoint site URL and list name required")
-        _sharepoint_manager = SharePointManager(site_url, list_name)
+    manager = _sharepoint_manager
+    if manager is None:
+        # Requests are handled on several threads; make sure only one manager is created
+        with _sharepoint_manager_lock:
+            if _sharepoint_manager is None:
+                if not site_url or not list_name:
+                    raise ValueError("SharePoint site URL and list name required")
+                _sharepoint_manager = SharePointManager(site_url, list_name)
+            manager = _sharepoint_manager
+
+    return manager
+
 
-    return _sharepoint_manager
+def shutdown():
+    """Cancel any pending sign-in so the auth pool doesn't hold up process exit"""
+    if _sharepoint_manager is not None:
+        _sharepoint_manager._auth_cancel.set()
+    _auth_executor.shutdown(wait=False)